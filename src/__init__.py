@@ -9,16 +9,19 @@ SOLID Architecture:
 - Dependency Inversion: High-level modules depend on abstractions (base classes)
 """
 
+from typing import TYPE_CHECKING
+
 from .base import MediaProcessor, Downloader, ProcessingResult, MediaType
 from .registry import ProcessorRegistry, create_default_registry
 from .main import main, MediaBenchCLI
 
-from .processors import (
-    ImageCompressor,
-    VideoCompressor,
-    YouTubeVideoDownloader,
-    YouTubeAudioDownloader,
-)
+if TYPE_CHECKING:
+    from .processors import (
+        ImageCompressor,
+        VideoCompressor,
+        YouTubeVideoDownloader,
+        YouTubeAudioDownloader,
+    )
 
 __all__ = [
     # Base classes
@@ -38,3 +41,13 @@ __all__ = [
     "YouTubeVideoDownloader",
     "YouTubeAudioDownloader",
 ]
+
+
+def __getattr__(name: str):
+    # Processors pull in PIL and pytube; resolve them on first access
+    # so importing the package (e.g. for `--help`) stays cheap.
+    if name in __all__:
+        from . import processors
+
+        return getattr(processors, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
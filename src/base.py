@@ -6,7 +6,7 @@ Follows Interface Segregation and Dependency Inversion principles.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 
 
 class MediaType(Enum):
@@ -15,7 +15,7 @@ class MediaType(Enum):
     AUDIO = "audio"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessingResult:
     """Result of a media processing operation."""
 
@@ -36,6 +36,9 @@ class ProcessingResult:
 class MediaProcessor(ABC):
     """Abstract base class for all media processors."""
 
+    # Maps CLI argument names to process() parameter names
+    ARG_MAPPING: ClassVar[Dict[str, str]] = {}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -62,6 +65,9 @@ class MediaProcessor(ABC):
 class Downloader(ABC):
     """Abstract base class for media downloaders."""
 
+    # Maps CLI argument names to download() parameter names
+    ARG_MAPPING: ClassVar[Dict[str, str]] = {"output": "output_path"}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -24,6 +24,7 @@ class DynamicForm(QWidget):
     def __init__(self, operation, parent=None):
         super().__init__(parent)
         self.operation = operation
+        self._cli_args = operation.get_cli_args()
         self.fields = {}  # Map arg_name -> widget
         self.init_ui()
 
@@ -31,10 +32,8 @@ class DynamicForm(QWidget):
         layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
-        cli_args = self.operation.get_cli_args()
-
         # Sort args to put required ones first, but standard dict order is usually fine
-        for arg_name, config in cli_args.items():
+        for arg_name, config in self._cli_args.items():
             self._add_field(form_layout, arg_name, config)
 
         layout.addLayout(form_layout)
@@ -49,75 +48,9 @@ class DynamicForm(QWidget):
     def _add_field(self, layout, arg_name, config):
         """Creates a widget based on the argument configuration."""
         help_text = config.get("help", "")
-        default = config.get("default")
-        arg_type = config.get("type")
-
-        # Determine widget type
-        widget = None
-
-        # Check for specific naming conventions to determine file/folder pickers
-        # This is a heuristic based on the existing codebase conventions
-        is_path = (
-            "path" in arg_name
-            or "folder" in arg_name
-            or "file" in arg_name
-            or "output" in arg_name
-            or "input" in arg_name
-        )
-
-        if config.get("choices"):
-            widget = QComboBox()
-            widget.addItems([str(c) for c in config["choices"]])
-            if default:
-                index = widget.findText(str(default))
-                if index >= 0:
-                    widget.setCurrentIndex(index)
-
-        elif is_path:
-            # Determine if it should be a folder or file selector
-            is_folder_selector = (
-                "folder" in arg_name or "dir" in arg_name or "output" in arg_name
-            )
-            is_multi_file = False
-
-            # Special case for Image Compressor input which expects files (multi)
-            if (
-                getattr(self.operation, "name", "") == "Image Compressor"
-                and arg_name == "input"
-            ):
-                is_folder_selector = False
-                is_multi_file = True
-
-            widget = PathSelector(
-                mode="folder" if is_folder_selector else "file",
-                save_mode="output" in arg_name,
-                multi_file=is_multi_file,
-            )
-            if default:
-                widget.set_path(str(default))
-
-        elif arg_type is int:
-            widget = QSpinBox()
-            widget.setRange(0, 10000)  # Arbitrary large range
-            if "quality" in arg_name:
-                widget.setRange(0, 100)
-            if default is not None:
-                widget.setValue(default)
-
-        elif arg_type is bool or config.get("action") in ["store_true", "store_false"]:
-            widget = QCheckBox()
-            if default:
-                widget.setChecked(True)
 
-        else:
-            # Default to text input
-            widget = QLineEdit()
-            if default is not None:
-                widget.setText(str(default))
-
-            # Special case for URL
-            if "url" in arg_name:
-                widget.setPlaceholderText("https://...")
+        factory = _WIDGET_FACTORIES[_widget_kind(arg_name, config)]
+        widget = factory(self, arg_name, config)
 
         # Add tooltip
         widget.setToolTip(help_text)
@@ -163,7 +96,7 @@ class DynamicForm(QWidget):
 
             # Simple validation for required fields
             # In a real app, we'd do better validation
-            config = self.operation.get_cli_args().get(name, {})
+            config = self._cli_args.get(name, {})
             if (
                 config.get("required")
                 and not value
@@ -181,10 +114,11 @@ class DynamicForm(QWidget):
 class PathSelector(QWidget):
     """Composite widget for selecting a file or folder path."""
 
-    def __init__(self, mode="file", save_mode=False, parent=None):
+    def __init__(self, mode="file", save_mode=False, multi_file=False, parent=None):
         super().__init__(parent)
         self.mode = mode  # 'file' or 'folder'
         self.save_mode = save_mode
+        self.multi_file = multi_file  # Join multiple selections with ';'
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -203,6 +137,9 @@ class PathSelector(QWidget):
         else:
             if self.save_mode:
                 path, _ = QFileDialog.getSaveFileName(self, "Save File")
+            elif self.multi_file:
+                paths, _ = QFileDialog.getOpenFileNames(self, "Open Files")
+                path = ";".join(paths)
             else:
                 path, _ = QFileDialog.getOpenFileName(self, "Open File")
 
@@ -214,3 +151,98 @@ class PathSelector(QWidget):
 
     def set_path(self, path):
         self.line_edit.setText(path)
+
+
+# Substrings of an argument name that mark it as a file/folder path.
+# This is a heuristic based on the existing codebase conventions
+_PATH_HINTS = ("path", "folder", "file", "output", "input")
+_FOLDER_HINTS = ("folder", "dir", "output")
+
+
+def _widget_kind(arg_name, config):
+    """Normalise an argument config to a key of _WIDGET_FACTORIES."""
+    if config.get("choices"):
+        return "choice"
+    if any(hint in arg_name for hint in _PATH_HINTS):
+        return "path"
+    arg_type = config.get("type")
+    if arg_type is int:
+        return "int"
+    if arg_type is bool or config.get("action") in ("store_true", "store_false"):
+        return "bool"
+    return "text"
+
+
+def _make_combo(form, arg_name, config):
+    widget = QComboBox()
+    widget.addItems([str(c) for c in config["choices"]])
+    default = config.get("default")
+    if default:
+        index = widget.findText(str(default))
+        if index >= 0:
+            widget.setCurrentIndex(index)
+    return widget
+
+
+def _make_path(form, arg_name, config):
+    # Determine if it should be a folder or file selector
+    is_folder_selector = any(hint in arg_name for hint in _FOLDER_HINTS)
+    is_multi_file = False
+
+    # Special case for Image Compressor input which expects files (multi)
+    if (
+        getattr(form.operation, "name", "") == "Image Compressor"
+        and arg_name == "input"
+    ):
+        is_folder_selector = False
+        is_multi_file = True
+
+    widget = PathSelector(
+        mode="folder" if is_folder_selector else "file",
+        save_mode="output" in arg_name,
+        multi_file=is_multi_file,
+    )
+    default = config.get("default")
+    if default:
+        widget.set_path(str(default))
+    return widget
+
+
+def _make_spin(form, arg_name, config):
+    widget = QSpinBox()
+    widget.setRange(0, 10000)  # Arbitrary large range
+    if "quality" in arg_name:
+        widget.setRange(0, 100)
+    default = config.get("default")
+    if default is not None:
+        widget.setValue(default)
+    return widget
+
+
+def _make_check(form, arg_name, config):
+    widget = QCheckBox()
+    if config.get("default"):
+        widget.setChecked(True)
+    return widget
+
+
+def _make_text(form, arg_name, config):
+    # Default to text input
+    widget = QLineEdit()
+    default = config.get("default")
+    if default is not None:
+        widget.setText(str(default))
+
+    # Special case for URL
+    if "url" in arg_name:
+        widget.setPlaceholderText("https://...")
+    return widget
+
+
+_WIDGET_FACTORIES = {
+    "choice": _make_combo,
+    "path": _make_path,
+    "int": _make_spin,
+    "bool": _make_check,
+    "text": _make_text,
+}
@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
     QStatusBar,
 )
 from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import QThreadPool, QTimer
 
 from .widgets import DynamicForm
 from .workers import Worker
@@ -20,7 +21,7 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.registry = create_default_registry()
-        self.workers = []  # Keep references to running workers
+        self._pending_log = []  # Messages waiting for the next batched flush
         self.init_ui()
 
     def init_ui(self):
@@ -91,50 +92,16 @@ class MainWindow(QMainWindow):
         self.log(f"Starting {operation.name}...")
         self.status_bar.showMessage(f"Running {operation.name}...")
 
-        # Argument Mapping (Logic adapted from src/main.py)
         # Map CLI arg names to method parameter names
-        mapped_kwargs = kwargs.copy()
-        arg_mapping = {}
-
-        # Check command key to determine mapping
-        # We need the key (e.g. 'compress-images') but we only have the operation object
-        # We can deduce it or check operation type/name
-
-        # Identify operation type by checking class name or attributes
-        op_type = type(operation).__name__
-
-        if op_type == "ImageCompressor":
-            arg_mapping = {
-                "input": "input_paths",
-                "output": "output_folder",
-            }
-        elif op_type == "VideoCompressor":
-            arg_mapping = {
-                "input": "input_file",
-                "output": "output_dir",
-            }
-        elif op_type in ["YouTubeVideoDownloader", "YouTubeAudioDownloader"]:
-            arg_mapping = {"output": "output_path"}
-
-        # Apply mapping
-        final_kwargs = {}
-        for key, value in mapped_kwargs.items():
-            mapped_key = arg_mapping.get(key, key)
-            final_kwargs[mapped_key] = value
-
-        # Create Worker
-        worker = Worker(operation, **final_kwargs)
-        worker.finished.connect(self.on_process_finished)
-        worker.error.connect(self.on_process_error)
-
-        # Store worker to prevent garbage collection
-        self.workers.append(worker)
+        mapping = operation.ARG_MAPPING
+        final_kwargs = {mapping.get(k, k): v for k, v in kwargs.items()}
 
-        # Remove worker from list when done
-        worker.finished.connect(lambda: self.cleanup_worker(worker))
-        worker.error.connect(lambda: self.cleanup_worker(worker))
+        # Run on the shared pool, which caps concurrency and reuses threads
+        worker = Worker(operation, **final_kwargs)
+        worker.signals.finished.connect(self.on_process_finished)
+        worker.signals.error.connect(self.on_process_error)
 
-        worker.start()
+        QThreadPool.globalInstance().start(worker)
 
     def on_process_finished(self, result: ProcessingResult):
         if result.success:
@@ -154,12 +121,17 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Error occurred")
         self.log("-" * 50)
 
-    def cleanup_worker(self, worker):
-        if worker in self.workers:
-            self.workers.remove(worker)
-
     def log(self, message):
-        self.log_output.append(message)
+        # Coalesce bursts of messages into a single append/repaint
+        if not self._pending_log:
+            QTimer.singleShot(50, self._flush_log)
+        self._pending_log.append(message)
+
+    def _flush_log(self):
+        if not self._pending_log:
+            return
+        self.log_output.append("\n".join(self._pending_log))
+        self._pending_log = []
         # Scroll to bottom
         cursor = self.log_output.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
@@ -1,20 +1,28 @@
 import traceback
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class Worker(QThread):
+class WorkerSignals(QObject):
     """
-    Worker thread to run media processing tasks in the background.
+    Signals emitted by a Worker. QRunnable is not a QObject, so the
+    signals live on this companion object.
     """
 
     finished = pyqtSignal(object)  # Emits ProcessingResult
     error = pyqtSignal(str)
     progress = pyqtSignal(str)  # Emits status messages
 
+
+class Worker(QRunnable):
+    """
+    Runnable that executes a media processing task on a pooled thread.
+    """
+
     def __init__(self, operation, **kwargs):
         super().__init__()
         self.operation = operation
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
 
     def run(self):
         try:
@@ -29,6 +37,6 @@ class Worker(QThread):
             else:
                 raise ValueError(f"Unknown operation type: {type(self.operation)}")
 
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(f"Error: {str(e)}\n{traceback.format_exc()}")
+            self.signals.error.emit(f"Error: {str(e)}\n{traceback.format_exc()}")
@@ -20,9 +20,10 @@ Examples:
     python -m src.main youtube-video -u "https://youtube.com/watch?v=..." -o ./videos
     python -m src.main youtube-audio -u "https://youtube.com/watch?v=..." --wav
 """
+
 import argparse
 import sys
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from .base import MediaProcessor, Downloader, ProcessingResult
 from .registry import create_default_registry, ProcessorRegistry
@@ -33,9 +34,22 @@ class MediaBenchCLI:
 
     def __init__(self, registry: Optional[ProcessorRegistry] = None):
         self.registry = registry or create_default_registry()
+        # Parsers built so far, keyed by the command they were built for
+        self._parsers: Dict[Optional[str], argparse.ArgumentParser] = {}
+
+    def create_parser(
+        self, commands: Optional[Iterable[str]] = None
+    ) -> argparse.ArgumentParser:
+        """
+        Create the argument parser with all subcommands.
+
+        Only the subcommands in commands (all of them by default) get their
+        operation's arguments; the others are listed from registry metadata,
+        so their processor modules are not imported.
+        """
+        if commands is not None:
+            commands = set(commands)
 
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser with all subcommands."""
         parser = argparse.ArgumentParser(
             prog="mediabench",
             description="MediaBench - Unified media processing toolkit",
@@ -50,12 +64,18 @@ class MediaBenchCLI:
         )
 
         # Add processor subcommands
-        for key, processor in self.registry.list_processors().items():
-            self._add_subparser(subparsers, key, processor)
+        for key, info in self.registry.describe_processors().items():
+            processor = None
+            if commands is None or key in commands:
+                processor = self.registry.get_processor(key)
+            self._add_subparser(subparsers, key, info.name, processor)
 
         # Add downloader subcommands
-        for key, downloader in self.registry.list_downloaders().items():
-            self._add_subparser(subparsers, key, downloader)
+        for key, info in self.registry.describe_downloaders().items():
+            downloader = None
+            if commands is None or key in commands:
+                downloader = self.registry.get_downloader(key)
+            self._add_subparser(subparsers, key, info.name, downloader)
 
         return parser
 
@@ -63,24 +83,34 @@ class MediaBenchCLI:
         self,
         subparsers,
         key: str,
-        operation,
+        name: str,
+        operation=None,
     ) -> None:
         """Add a subparser for a processor or downloader."""
         subparser = subparsers.add_parser(
             key,
-            help=operation.name,
-            description=operation.name,
+            help=name,
+            description=name,
         )
+        if operation is None:
+            return
 
         cli_args = operation.get_cli_args()
         for arg_name, arg_config in cli_args.items():
-            flags = arg_config.pop("flags")
-            subparser.add_argument(*flags, **arg_config)
-            arg_config["flags"] = flags  # Restore for potential reuse
+            options = {k: v for k, v in arg_config.items() if k != "flags"}
+            subparser.add_argument(*arg_config["flags"], **options)
 
     def run(self, args: Optional[list] = None) -> int:
         """Run the CLI with given arguments."""
-        parser = self.create_parser()
+        if args is None:
+            args = sys.argv[1:]
+        # The top-level parser has no options taking values, so the first
+        # positional is the command; only its operation needs importing
+        command = next((arg for arg in args if not arg.startswith("-")), None)
+        parser = self._parsers.get(command)
+        if parser is None:
+            parser = self.create_parser(() if command is None else (command,))
+            self._parsers[command] = parser
         parsed_args = parser.parse_args(args)
 
         if not parsed_args.command:
@@ -96,28 +126,22 @@ class MediaBenchCLI:
         command = args.command
         kwargs = {k: v for k, v in vars(args).items() if k != "command"}
 
-        # Map CLI arg names to method parameter names
-        arg_mapping = {
-            "input": "input_paths" if "compress-images" in command else "input_file",
-            "output": "output_folder" if "compress-images" in command else "output_dir",
-        }
-
-        # Special handling for downloaders
-        if command in ["youtube-video", "youtube-audio"]:
-            arg_mapping = {"output": "output_path"}
-
-        mapped_kwargs = {}
-        for key, value in kwargs.items():
-            mapped_key = arg_mapping.get(key, key)
-            mapped_kwargs[mapped_key] = value
-
         try:
             # Try processor first, then downloader
             try:
                 operation = self.registry.get_processor(command)
-                result = operation.process(**mapped_kwargs)
+                is_processor = True
             except KeyError:
                 operation = self.registry.get_downloader(command)
+                is_processor = False
+
+            # Map CLI arg names to method parameter names
+            mapping = operation.ARG_MAPPING
+            mapped_kwargs = {mapping.get(k, k): v for k, v in kwargs.items()}
+
+            if is_processor:
+                result = operation.process(**mapped_kwargs)
+            else:
                 result = operation.download(**mapped_kwargs)
 
             self._print_result(result)
@@ -147,17 +171,17 @@ class MediaBenchCLI:
         """Print all available operations."""
         print("\n📋 Available Operations:\n")
 
-        processors = self.registry.list_processors()
+        processors = self.registry.describe_processors()
         if processors:
             print("  Processors:")
-            for key, proc in processors.items():
-                print(f"    • {key}: {proc.name} ({proc.media_type.value})")
+            for key, info in processors.items():
+                print(f"    • {key}: {info.name} ({info.media_type.value})")
 
-        downloaders = self.registry.list_downloaders()
+        downloaders = self.registry.describe_downloaders()
         if downloaders:
             print("\n  Downloaders:")
-            for key, dl in downloaders.items():
-                print(f"    • {key}: {dl.name} (source: {dl.source})")
+            for key, info in downloaders.items():
+                print(f"    • {key}: {info.name} (source: {info.source})")
 
         print()
 
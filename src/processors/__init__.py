@@ -1,8 +1,21 @@
 """Media processors package."""
 
-from .image import ImageCompressor
-from .video import VideoCompressor
-from .youtube import YouTubeVideoDownloader, YouTubeAudioDownloader
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .image import ImageCompressor
+    from .video import VideoCompressor
+    from .youtube import YouTubeVideoDownloader, YouTubeAudioDownloader
+
+# Each processor module imports its heavy media library at load time, so
+# they are only imported when the corresponding class is first requested.
+_LAZY_IMPORTS = {
+    "ImageCompressor": ".image",
+    "VideoCompressor": ".video",
+    "YouTubeVideoDownloader": ".youtube",
+    "YouTubeAudioDownloader": ".youtube",
+}
 
 __all__ = [
     "ImageCompressor",
@@ -10,3 +23,9 @@ __all__ = [
     "YouTubeVideoDownloader",
     "YouTubeAudioDownloader",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
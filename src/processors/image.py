@@ -3,20 +3,319 @@ Image compression processor.
 Single Responsibility: Only handles image compression logic.
 """
 
+import io
 import os
 import shutil
-from typing import Optional
+from stat import S_ISDIR
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    ClassVar,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from PIL import Image
 from tqdm import tqdm
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; Pillow handles every format without it
+    cv2 = None
+
+try:
+    from turbojpeg import TJFLAG_PROGRESSIVE, TJSAMP_420, TurboJPEG
+
+    _turbo = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG is optional and also needs the libturbojpeg shared library
+    _turbo = None
+
 from ..base import MediaProcessor, MediaType, ProcessingResult
 
+# (input_path, output_path, quality, max_dimension, input_size)
+CompressionTask = Tuple[str, str, int, Optional[int], int]
+
+# (st_dev, st_ino, st_mtime_ns, output format extension)
+SourceKey = Tuple[int, int, int, str]
+
+# Extensions that share an output format, mapped to one spelling
+_FORMAT_EXTENSIONS = {".jpeg": ".jpg"}
+
+# Image modes the JPEG encoder accepts without conversion
+_JPEG_MODES = frozenset({"L", "RGB", "YCbCr", "CMYK"})
+
+# Low-end JPEG output size in bits per pixel for 4:2:0 photos, keyed by
+# quality // 10. Sources already at or below this are copied, not re-encoded.
+_BPP_TABLE = {
+    0: 0.2,
+    1: 0.3,
+    2: 0.45,
+    3: 0.55,
+    4: 0.65,
+    5: 0.75,
+    6: 0.85,
+    7: 1.0,
+    8: 1.25,
+    9: 1.7,
+    10: 3.5,
+}
+
+
+class _ImageOutcome(NamedTuple):
+    """Per-image result handed back from the worker pool."""
+
+    output_size: int
+    copied: bool = False
+    error: Optional[str] = None
+
+
+def _compress_worker(task: CompressionTask) -> _ImageOutcome:
+    """Pool entry point: compress one CompressionTask."""
+    return ImageCompressor._compress_single_image(*task)
+
+
+def _encode_image(
+    img: Image.Image,
+    input_path: str,
+    output_path: str,
+    quality: int,
+    max_dimension: Optional[int],
+) -> None:
+    """Re-encode an opened image to output_path, tuned for its format."""
+    ext = os.path.splitext(output_path)[1].lower()
+    if (
+        ext in (".jpg", ".jpeg")
+        and img.format == "JPEG"
+        and img.mode == "RGB"
+        and not (max_dimension and max(img.size) > max_dimension)
+    ):
+        # Native JPEG-to-JPEG fast paths, tried in order of preference
+        for encode in _JPEG_BACKENDS:
+            if encode(input_path, output_path, quality):
+                return
+
+    if ext in (".jpg", ".jpeg") and img.format == "JPEG":
+        # Decode straight to YCbCr so the re-encode skips the
+        # YCbCr -> RGB -> YCbCr colour conversion round trip. When
+        # downscaling, also let libjpeg's scaled IDCT decode at 1/2, 1/4 or
+        # 1/8 size, keeping at least twice the target (thumbnail()'s own
+        # reducing gap) for the final resample
+        if max_dimension and max(img.size) > max_dimension:
+            img.draft("YCbCr", (max_dimension * 2, max_dimension * 2))
+        else:
+            img.draft("YCbCr", img.size)
+        img.load()
+
+    img = _maybe_resize(img, max_dimension)
+
+    if ext in (".jpg", ".jpeg"):
+        # Convert once up front instead of inside save(); JPEG
+        # cannot store alpha or palette images
+        if img.mode not in _JPEG_MODES:
+            img = img.convert("RGB")
+        _save_buffered(
+            img,
+            output_path,
+            "JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=True,
+            subsampling=2,
+        )
+    elif ext == ".png":
+        # PNG is lossless and ignores quality; optimize already runs zlib at
+        # its highest level (9), so no separate compress_level is passed
+        _save_buffered(img, output_path, "PNG", optimize=True)
+    else:
+        _save_buffered(
+            img,
+            output_path,
+            Image.registered_extensions()[ext],
+            quality=quality,
+            optimize=True,
+        )
+
+
+def _save_buffered(img: Image.Image, output_path: str, fmt: str, **params) -> None:
+    """
+    Encode img into memory, then write it out with a single write call.
+
+    Saving to a path makes Pillow write in encoder-block-sized chunks, one
+    syscall each; for many small images those dominate the I/O.
+    """
+    buf = io.BytesIO()
+    img.save(buf, fmt, **params)
+    with open(output_path, "wb") as f:
+        f.write(buf.getbuffer())
+
+
+def _is_already_compact(
+    input_size: int, img: Image.Image, quality: int, max_dimension: Optional[int]
+) -> bool:
+    """Whether a JPEG source is no larger than re-encoding it would produce."""
+    if img.format != "JPEG" or (max_dimension and max(img.size) > max_dimension):
+        return False
+    bucket = min(10, max(0, quality // 10))
+    # No safety margin on top: the table is already at the low end of what
+    # libjpeg produces, so borderline sources are re-encoded rather than kept
+    estimate = img.width * img.height * _BPP_TABLE[bucket] / 8
+    return input_size <= estimate
+
+
+def _encode_jpeg_cv2(input_path: str, output_path: str, quality: int) -> bool:
+    """
+    Re-encode a JPEG with OpenCV's libjpeg-turbo binding in a single C call.
+
+    Returns False when OpenCV cannot decode the source, so the caller can
+    fall back to Pillow.
+    """
+    # Ignore EXIF orientation so the pixels match what Pillow would write
+    arr = cv2.imread(input_path, cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if arr is None:
+        return False
+    ok, buf = cv2.imencode(
+        ".jpg",
+        arr,
+        [
+            cv2.IMWRITE_JPEG_QUALITY,
+            quality,
+            cv2.IMWRITE_JPEG_OPTIMIZE,
+            1,
+            cv2.IMWRITE_JPEG_PROGRESSIVE,
+            1,
+        ],
+    )
+    if not ok:
+        return False
+    with open(output_path, "wb") as f:
+        f.write(buf.tobytes())
+    return True
+
+
+def _encode_jpeg_turbo(input_path: str, output_path: str, quality: int) -> bool:
+    """
+    Re-encode a JPEG with libturbojpeg's SIMD codec via PyTurboJPEG.
+
+    Returns False when libturbojpeg cannot decode or encode the image, so
+    the caller can fall back to the next backend.
+    """
+    with open(input_path, "rb") as f:
+        source = f.read()
+    try:
+        arr = _turbo.decode(source)
+        data = _turbo.encode(
+            arr, quality=quality, jpeg_subsample=TJSAMP_420, flags=TJFLAG_PROGRESSIVE
+        )
+    except OSError:
+        return False
+    with open(output_path, "wb") as f:
+        f.write(data)
+    return True
+
+
+# Optional accelerated JPEG encoders available in this environment
+_JPEG_BACKENDS = [
+    encoder
+    for encoder, available in (
+        (_encode_jpeg_turbo, _turbo is not None),
+        (_encode_jpeg_cv2, cv2 is not None),
+    )
+    if available
+]
+
+
+def _maybe_resize(img: Image.Image, max_dimension: Optional[int]) -> Image.Image:
+    """Lanczos-downscale img in place so its longest side fits max_dimension."""
+    if max_dimension:
+        # No-op when the image already fits
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    return img
+
+
+def _make_executor(processes: bool) -> Executor:
+    """Create the worker pool used for folder compression."""
+    if processes:
+        return ProcessPoolExecutor(max_workers=os.cpu_count())
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _link_or_copy(
+    input_path: str, output_path: str, stat: os.stat_result, symlink: bool = False
+) -> None:
+    """
+    Place a file in the output tree without copying its data.
+
+    A hardlink (or symlink) is O(1) regardless of file size; when linking is
+    not possible, e.g. across filesystems (EXDEV), the file is copied.
+    """
+    link = os.symlink if symlink else os.link
+    target = os.path.abspath(input_path) if symlink else input_path
+    try:
+        try:
+            link(target, output_path)
+        except FileExistsError:
+            if os.path.samefile(input_path, output_path):
+                # Output folder is the input folder, or an earlier run
+                # already linked this file; removing it would lose the data
+                return
+            # Left over from a previous run into the same output folder
+            os.remove(output_path)
+            link(target, output_path)
+    except OSError:
+        # copyfile takes the in-kernel sendfile fast path; only the
+        # timestamps are carried over, reusing the scandir stat
+        shutil.copyfile(input_path, output_path)
+        os.utime(output_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def _source_key(stat: os.stat_result, output_path: str) -> Optional[SourceKey]:
+    """
+    Identity of a source file's contents for de-duplicating inputs.
+
+    Paths that share a device, inode and mtime (hardlinks, or the same file
+    reached twice) compress to identical output as long as they are written
+    in the same format, so the output extension is part of the key. Platforms
+    without real inode numbers report 0, which would make every file look
+    the same.
+    """
+    if not stat.st_ino:
+        return None
+    ext = os.path.splitext(output_path)[1].lower()
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, _FORMAT_EXTENSIONS.get(ext, ext)
+
+
+def _iter_files(root: str) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Yield (entry, relative_dir) for every file below root using os.scandir.
+
+    The DirEntry carries cached type and stat information, so callers can
+    read sizes without issuing a separate stat per path.
+    """
+    stack = [(root, "")]
+    while stack:
+        folder, rel_dir = stack.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, os.path.join(rel_dir, entry.name)))
+                elif entry.is_file():
+                    yield entry, rel_dir
+
 
 class ImageCompressor(MediaProcessor):
     """Compresses images in a folder with configurable quality."""
 
-    SUPPORTED_EXTENSIONS = (".jpg", ".jpeg", ".png")
+    SUPPORTED_EXTENSIONS: Final[FrozenSet[str]] = frozenset({".jpg", ".jpeg", ".png"})
+    ARG_MAPPING: ClassVar[Dict[str, str]] = {
+        "input": "input_paths",
+        "output": "output_folder",
+    }
 
     @property
     def name(self) -> str:
@@ -47,6 +346,30 @@ class ImageCompressor(MediaProcessor):
                 "default": 85,
                 "help": "Quality level of the compressed images (0-100)",
             },
+            "max_dimension": {
+                "flags": ["--max-dimension"],
+                "type": int,
+                "default": None,
+                "help": "Downscale images whose longest side exceeds this many pixels",
+            },
+            "processes": {
+                "flags": ["--processes"],
+                "action": "store_true",
+                "default": False,
+                "help": "Compress in worker processes instead of threads",
+            },
+            "symlink_passthrough": {
+                "flags": ["--symlink-passthrough"],
+                "action": "store_true",
+                "default": False,
+                "help": "Symlink non-image files into the output instead of hardlinking",
+            },
+            "dedupe": {
+                "flags": ["--dedupe"],
+                "action": "store_true",
+                "default": False,
+                "help": "Compress hardlinked or repeated inputs once and link the copies",
+            },
         }
 
     def process(
@@ -54,6 +377,10 @@ class ImageCompressor(MediaProcessor):
         input_paths: List[str],
         output_folder: str,
         quality: int = 85,
+        max_dimension: Optional[int] = None,
+        processes: bool = False,
+        symlink_passthrough: bool = False,
+        dedupe: bool = False,
         **kwargs,
     ) -> ProcessingResult:
         """Compress images from input paths and save to output_folder."""
@@ -62,34 +389,77 @@ class ImageCompressor(MediaProcessor):
             input_paths = [input_paths]
 
         os.makedirs(output_folder, exist_ok=True)
-
-        # Calculate total original size
-        original_size = 0
-        for path in input_paths:
-            if os.path.isfile(path):
-                original_size += os.path.getsize(path)
-            elif os.path.isdir(path):
-                original_size += self._calculate_folder_size(path)
+        # Per-run state stays local: one instance may serve concurrent runs
+        log: List[str] = []
+        failures: List[Tuple[str, str]] = []
+        # Source key -> output path of the first compressed copy, or None
+        # when that copy failed
+        compressed: Optional[Dict[SourceKey, Optional[str]]] = {} if dedupe else None
 
         try:
+            original_size = 0
+            processed_size = 0
             for path in input_paths:
-                if os.path.isfile(path):
-                    if path.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                        print(f"Compressing {os.path.basename(path)}.")
-                        output_path = os.path.join(
-                            output_folder, os.path.basename(path)
+                # One stat per input answers both "file or folder?" and "size?"
+                try:
+                    path_stat = os.stat(path)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Path not found: {path}") from None
+
+                if S_ISDIR(path_stat.st_mode):
+                    folder_original, folder_processed = self._compress_folder(
+                        path,
+                        output_folder,
+                        quality,
+                        log,
+                        failures,
+                        max_dimension,
+                        processes,
+                        symlink_passthrough,
+                        compressed,
+                    )
+                    original_size += folder_original
+                    processed_size += folder_processed
+                elif os.path.splitext(path)[1].lower() in self.SUPPORTED_EXTENSIONS:
+                    output_path = os.path.join(output_folder, os.path.basename(path))
+                    original_size += path_stat.st_size
+                    key = (
+                        _source_key(path_stat, output_path)
+                        if compressed is not None
+                        else None
+                    )
+                    if key is not None and key in compressed:
+                        processed_size += self._link_duplicate(
+                            path, compressed[key], output_path, log, failures
                         )
-                        self._compress_single_image(path, output_path, quality)
-                elif os.path.isdir(path):
-                    self._compress_folder(path, output_folder, quality)
-                else:
-                    print(f"Path not found: {path}")
+                        continue
+                    if key is not None:
+                        compressed[key] = output_path
+                    log.append(f"Compressing {os.path.basename(path)}.")
+                    outcome = self._compress_single_image(
+                        path,
+                        output_path,
+                        quality,
+                        max_dimension,
+                        path_stat.st_size,
+                    )
+                    if key is not None and outcome.error is not None:
+                        compressed[key] = None
+                    processed_size += self._record_outcome(path, outcome, log, failures)
 
-            processed_size = self._calculate_folder_size(output_folder)
+            message = "Image compression completed successfully."
+            if failures:
+                message = (
+                    f"Image compression completed with {len(failures)} "
+                    "failure(s): "
+                    + "; ".join(
+                        f"{os.path.basename(path)}: {error}" for path, error in failures
+                    )
+                )
 
             return ProcessingResult(
                 success=True,
-                message="Image compression completed successfully.",
+                message=message,
                 input_path=", ".join(input_paths),
                 output_path=output_folder,
                 original_size=original_size,
@@ -100,47 +470,176 @@ class ImageCompressor(MediaProcessor):
                 success=False,
                 message=f"Error during compression: {e}",
             )
+        finally:
+            # Emit buffered log messages in a single write
+            if log:
+                print("\n".join(log))
+
+    @staticmethod
+    def _record_outcome(
+        input_path: str,
+        outcome: _ImageOutcome,
+        log: List[str],
+        failures: List[Tuple[str, str]],
+    ) -> int:
+        """Log or collect a per-image outcome and return its output size."""
+        if outcome.error is not None:
+            failures.append((input_path, outcome.error))
+        elif outcome.copied:
+            log.append(
+                f"{os.path.basename(input_path)} is already compact. Copied unchanged."
+            )
+        return outcome.output_size
+
+    @staticmethod
+    def _link_duplicate(
+        input_path: str,
+        compressed_path: Optional[str],
+        output_path: str,
+        log: List[str],
+        failures: List[Tuple[str, str]],
+    ) -> int:
+        """Link the already compressed copy of input_path to output_path."""
+        if compressed_path is None:
+            # The first copy failed to compress and has been reported
+            failures.append((input_path, "duplicate of a failed input"))
+            return 0
+        stat = os.stat(compressed_path)
+        if os.path.abspath(compressed_path) != os.path.abspath(output_path):
+            _link_or_copy(compressed_path, output_path, stat)
+        log.append(
+            f"{os.path.basename(input_path)} duplicates an earlier input. Linked."
+        )
+        return stat.st_size
 
     def _compress_folder(
-        self, input_folder: str, output_folder: str, quality: int
-    ) -> None:
-        """Recursively compress images in a folder."""
-        for root, _, files in tqdm(
-            os.walk(input_folder),
-            total=len(os.listdir(input_folder)),
-            desc="Compressing images recursively",
-        ):
-            print(f"Compressing images in {root}.")
-            for filename in files:
-                print(f"Compressing {filename}.")
-                input_path = os.path.join(root, filename)
-                output_path = os.path.join(
-                    output_folder, os.path.relpath(input_path, input_folder)
+        self,
+        input_folder: str,
+        output_folder: str,
+        quality: int,
+        log: List[str],
+        failures: List[Tuple[str, str]],
+        max_dimension: Optional[int] = None,
+        processes: bool = False,
+        symlink_passthrough: bool = False,
+        compressed: Optional[Dict[SourceKey, Optional[str]]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Recursively compress images in a folder using a worker pool.
+
+        Pillow releases the GIL while decoding and encoding, so a thread pool
+        is used by default; processes=True switches to a process pool for
+        builds where that does not hold.
+
+        When a compressed map is given, images whose source key is already
+        in it are linked to that output after the pool finishes instead of
+        being compressed again. Per-image messages and failures are appended
+        to the caller's log and failures lists.
+
+        Returns the (original_size, processed_size) byte totals of the files
+        handled, accounted during the same traversal that collects the work.
+        """
+        tasks: List[CompressionTask] = []
+        passthrough: List[Tuple[str, str, os.stat_result]] = []
+        task_keys: List[Optional[SourceKey]] = []
+        duplicates: List[Tuple[str, SourceKey, str]] = []
+        created_dirs = set()
+        original_size = 0
+
+        for entry, rel_dir in _iter_files(input_folder):
+            output_root = os.path.join(output_folder, rel_dir)
+            output_path = os.path.join(output_root, entry.name)
+            stat = entry.stat()
+            original_size += stat.st_size
+
+            if output_root not in created_dirs:
+                os.makedirs(output_root, exist_ok=True)
+                created_dirs.add(output_root)
+
+            if os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_EXTENSIONS:
+                key = _source_key(stat, output_path) if compressed is not None else None
+                if key is not None:
+                    if key in compressed:
+                        duplicates.append((entry.path, key, output_path))
+                        continue
+                    compressed[key] = output_path
+                tasks.append(
+                    (entry.path, output_path, quality, max_dimension, stat.st_size)
                 )
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                task_keys.append(key)
+            else:
+                passthrough.append((entry.path, output_path, stat))
 
-                if filename.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                    self._compress_single_image(input_path, output_path, quality)
-                else:
-                    print(f"{filename} is not an image file. Skipping...")
-                    shutil.copy2(input_path, output_path)
+        processed_size = 0
+        with _make_executor(processes) as executor:
+            # map() submits every task up front, so the pool is already busy
+            # encoding while this thread copies the non-image files
+            results = executor.map(_compress_worker, tasks, chunksize=16)
 
-    def _compress_single_image(
-        self, input_path: str, output_path: str, quality: int
-    ) -> None:
-        """Compress a single image file."""
-        try:
-            img = Image.open(input_path)
-            img.save(output_path, quality=quality)
-        except Exception as e:
-            print(f"Error compressing image {input_path}: {e}")
+            for input_path, output_path, stat in passthrough:
+                log.append(
+                    f"{os.path.basename(input_path)} is not an image file. Skipping..."
+                )
+                _link_or_copy(input_path, output_path, stat, symlink_passthrough)
+                processed_size += stat.st_size
+
+            for task, key, outcome in zip(
+                tasks,
+                task_keys,
+                tqdm(
+                    results,
+                    total=len(tasks),
+                    desc="Compressing images recursively",
+                    mininterval=0.5,
+                    leave=False,
+                ),
+            ):
+                if key is not None and outcome.error is not None:
+                    compressed[key] = None
+                processed_size += self._record_outcome(task[0], outcome, log, failures)
+
+        # Linked only now, once every first copy has succeeded or failed
+        for input_path, key, output_path in duplicates:
+            processed_size += self._link_duplicate(
+                input_path, compressed[key], output_path, log, failures
+            )
+
+        return original_size, processed_size
 
     @staticmethod
-    def _calculate_folder_size(folder: str) -> int:
-        """Calculate total size of all files in a folder recursively."""
-        total_size = 0
-        for root, _, files in os.walk(folder):
-            for file in files:
-                file_path = os.path.join(root, file)
-                total_size += os.path.getsize(file_path)
-        return total_size
+    def _compress_single_image(
+        input_path: str,
+        output_path: str,
+        quality: int,
+        max_dimension: Optional[int] = None,
+        input_size: Optional[int] = None,
+    ) -> _ImageOutcome:
+        """
+        Compress a single image file.
+
+        input_size lets callers that already hold the source's stat (from
+        the folder scan) skip another stat call.
+
+        Failures while encoding are reported in the returned outcome rather
+        than raised; a source that cannot be opened at all halts the run.
+        """
+        if input_size is None:
+            input_size = os.stat(input_path).st_size
+
+        with Image.open(input_path) as img:
+            ext = os.path.splitext(output_path)[1].lower()
+            if ext in (".jpg", ".jpeg") and _is_already_compact(
+                input_size, img, quality, max_dimension
+            ):
+                try:
+                    shutil.copyfile(input_path, output_path)
+                except shutil.SameFileError:
+                    # Compressing in place; the source already is the output
+                    pass
+                return _ImageOutcome(input_size, copied=True)
+
+            try:
+                _encode_image(img, input_path, output_path, quality, max_dimension)
+            except Exception as e:
+                return _ImageOutcome(0, error=str(e))
+        return _ImageOutcome(os.stat(output_path).st_size)
@@ -3,69 +3,237 @@ Processor registry for managing available operations.
 Follows Open/Closed Principle: New processors can be registered without modifying existing code.
 """
 
-from typing import Dict, List, Type, Union
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, NamedTuple, Optional, TypeVar, Union
 
-from .base import MediaProcessor, Downloader
+from .base import MediaProcessor, Downloader, MediaType
+
+T = TypeVar("T")
+
+
+class ProcessorInfo(NamedTuple):
+    """What the CLI lists for a processor, known without instantiating it."""
+
+    name: str
+    media_type: MediaType
+
+
+class DownloaderInfo(NamedTuple):
+    """What the CLI lists for a downloader, known without instantiating it."""
+
+    name: str
+    source: str
+
+
+def _materialize(instances: Dict[str, T], factories: Dict[str, Callable[[], T]]):
+    """Instantiate every pending factory, keeping registration order."""
+    if len(instances) != len(factories):
+        built = {
+            key: instances[key] if key in instances else factory()
+            for key, factory in factories.items()
+        }
+        # Refill in place so the read-only views stay live
+        instances.clear()
+        instances.update(built)
 
 
 class ProcessorRegistry:
-    """Central registry for all media processors and downloaders."""
+    """
+    Central registry for all media processors and downloaders.
+
+    Operations may be registered as instances or as zero-argument factories
+    (e.g. the class itself); factories are only called on first lookup, so
+    their dependencies aren't imported until an operation is actually used.
+    Registering a factory together with its info lets callers list it
+    without instantiating it at all.
+    """
 
     def __init__(self):
+        # Registration order and factories for every key
+        self._processor_factories: Dict[str, Callable[[], MediaProcessor]] = {}
+        self._downloader_factories: Dict[str, Callable[[], Downloader]] = {}
+        # Instances created so far
         self._processors: Dict[str, MediaProcessor] = {}
         self._downloaders: Dict[str, Downloader] = {}
-
-    def register_processor(self, key: str, processor: MediaProcessor) -> None:
-        """Register a media processor."""
-        self._processors[key] = processor
-
-    def register_downloader(self, key: str, downloader: Downloader) -> None:
-        """Register a downloader."""
-        self._downloaders[key] = downloader
+        # Display metadata, given at registration or read from the instance
+        self._processor_info: Dict[str, ProcessorInfo] = {}
+        self._downloader_info: Dict[str, DownloaderInfo] = {}
+        # "Available: ..." text for lookup errors, reset on registration
+        self._processor_keys: Optional[str] = None
+        self._downloader_keys: Optional[str] = None
+        # Read-only live views, handed out instead of copying on every call
+        self._processors_view = MappingProxyType(self._processors)
+        self._downloaders_view = MappingProxyType(self._downloaders)
+
+    def register_processor(
+        self,
+        key: str,
+        processor: Union[MediaProcessor, Callable[[], MediaProcessor]],
+        info: Optional[ProcessorInfo] = None,
+    ) -> None:
+        """Register a media processor instance or factory."""
+        self._processor_keys = None
+        self._processors.pop(key, None)
+        self._processor_info.pop(key, None)
+        if info is not None:
+            self._processor_info[key] = info
+        if isinstance(processor, MediaProcessor):
+            self._processor_factories[key] = lambda: processor
+            self._processors[key] = processor
+        else:
+            self._processor_factories[key] = processor
+
+    def register_downloader(
+        self,
+        key: str,
+        downloader: Union[Downloader, Callable[[], Downloader]],
+        info: Optional[DownloaderInfo] = None,
+    ) -> None:
+        """Register a downloader instance or factory."""
+        self._downloader_keys = None
+        self._downloaders.pop(key, None)
+        self._downloader_info.pop(key, None)
+        if info is not None:
+            self._downloader_info[key] = info
+        if isinstance(downloader, Downloader):
+            self._downloader_factories[key] = lambda: downloader
+            self._downloaders[key] = downloader
+        else:
+            self._downloader_factories[key] = downloader
 
     def get_processor(self, key: str) -> MediaProcessor:
-        """Get a processor by key."""
-        if key not in self._processors:
+        """Get a processor by key, instantiating it on first use."""
+        try:
+            return self._processors[key]
+        except KeyError:
+            pass
+        if key not in self._processor_factories:
+            if self._processor_keys is None:
+                self._processor_keys = str(list(self._processor_factories))
             raise KeyError(
-                f"Processor '{key}' not found. Available: {list(self._processors.keys())}"
+                f"Processor '{key}' not found. Available: {self._processor_keys}"
             )
-        return self._processors[key]
+        processor = self._processors[key] = self._processor_factories[key]()
+        return processor
 
     def get_downloader(self, key: str) -> Downloader:
-        """Get a downloader by key."""
-        if key not in self._downloaders:
+        """Get a downloader by key, instantiating it on first use."""
+        try:
+            return self._downloaders[key]
+        except KeyError:
+            pass
+        if key not in self._downloader_factories:
+            if self._downloader_keys is None:
+                self._downloader_keys = str(list(self._downloader_factories))
             raise KeyError(
-                f"Downloader '{key}' not found. Available: {list(self._downloaders.keys())}"
+                f"Downloader '{key}' not found. Available: {self._downloader_keys}"
             )
-        return self._downloaders[key]
-
-    def list_processors(self) -> Dict[str, MediaProcessor]:
-        """List all registered processors."""
-        return self._processors.copy()
-
-    def list_downloaders(self) -> Dict[str, Downloader]:
-        """List all registered downloaders."""
-        return self._downloaders.copy()
+        downloader = self._downloaders[key] = self._downloader_factories[key]()
+        return downloader
+
+    def list_processors(self) -> Mapping[str, MediaProcessor]:
+        """List all registered processors as a read-only mapping."""
+        _materialize(self._processors, self._processor_factories)
+        return self._processors_view
+
+    def list_downloaders(self) -> Mapping[str, Downloader]:
+        """List all registered downloaders as a read-only mapping."""
+        _materialize(self._downloaders, self._downloader_factories)
+        return self._downloaders_view
+
+    def describe_processors(self) -> Dict[str, ProcessorInfo]:
+        """
+        Name and media type of every registered processor.
+
+        Only processors registered without info are instantiated.
+        """
+        for key in self._processor_factories.keys() - self._processor_info.keys():
+            processor = self.get_processor(key)
+            self._processor_info[key] = ProcessorInfo(
+                processor.name, processor.media_type
+            )
+        return {key: self._processor_info[key] for key in self._processor_factories}
+
+    def describe_downloaders(self) -> Dict[str, DownloaderInfo]:
+        """
+        Name and source of every registered downloader.
+
+        Only downloaders registered without info are instantiated.
+        """
+        for key in self._downloader_factories.keys() - self._downloader_info.keys():
+            downloader = self.get_downloader(key)
+            self._downloader_info[key] = DownloaderInfo(
+                downloader.name, downloader.source
+            )
+        return {key: self._downloader_info[key] for key in self._downloader_factories}
 
     def list_all(self) -> Dict[str, Union[MediaProcessor, Downloader]]:
         """List all registered operations."""
-        return {**self._processors, **self._downloaders}
+        return {**self.list_processors(), **self.list_downloaders()}
 
 
-def create_default_registry() -> ProcessorRegistry:
-    """Create a registry with all default processors registered."""
-    from .processors import (
-        ImageCompressor,
-        VideoCompressor,
-        YouTubeVideoDownloader,
-        YouTubeAudioDownloader,
-    )
+def _image_compressor() -> MediaProcessor:
+    from .processors import ImageCompressor
 
-    registry = ProcessorRegistry()
+    return ImageCompressor()
+
+
+def _video_compressor() -> MediaProcessor:
+    from .processors import VideoCompressor
+
+    return VideoCompressor()
+
+
+def _youtube_video_downloader() -> Downloader:
+    from .processors import YouTubeVideoDownloader
+
+    return YouTubeVideoDownloader()
 
-    registry.register_processor("compress-images", ImageCompressor())
-    registry.register_processor("compress-video", VideoCompressor())
-    registry.register_downloader("youtube-video", YouTubeVideoDownloader())
-    registry.register_downloader("youtube-audio", YouTubeAudioDownloader())
 
+def _youtube_audio_downloader() -> Downloader:
+    from .processors import YouTubeAudioDownloader
+
+    return YouTubeAudioDownloader()
+
+
+# Default operations as (key, factory, info) triples, in CLI/GUI listing
+# order; the info must match the name/media_type/source of the instance
+_DEFAULT_PROCESSORS = (
+    (
+        "compress-images",
+        _image_compressor,
+        ProcessorInfo("Image Compressor", MediaType.IMAGE),
+    ),
+    (
+        "compress-video",
+        _video_compressor,
+        ProcessorInfo("Video Compressor", MediaType.VIDEO),
+    ),
+)
+_DEFAULT_DOWNLOADERS = (
+    (
+        "youtube-video",
+        _youtube_video_downloader,
+        DownloaderInfo("YouTube Video Downloader", "YouTube"),
+    ),
+    (
+        "youtube-audio",
+        _youtube_audio_downloader,
+        DownloaderInfo("YouTube Audio Downloader", "YouTube"),
+    ),
+)
+
+
+def create_default_registry() -> ProcessorRegistry:
+    """
+    Create a registry with all default processors registered.
+
+    Each processor module (and its Pillow/pytube/... imports) is only loaded
+    when that operation is first looked up.
+    """
+    registry = ProcessorRegistry()
+    for key, factory, info in _DEFAULT_PROCESSORS:
+        registry.register_processor(key, factory, info)
+    for key, factory, info in _DEFAULT_DOWNLOADERS:
+        registry.register_downloader(key, factory, info)
     return registry
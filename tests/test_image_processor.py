@@ -1,9 +1,13 @@
+import io
 import os
 import tempfile
+import threading
 import unittest
+from unittest.mock import MagicMock, patch
 
 from PIL import Image
 
+from src.processors import image as image_module
 from src.processors.image import ImageCompressor
 
 
@@ -17,7 +21,7 @@ class TestImageCompressor(unittest.TestCase):
             img.save(img_path, quality=95)
 
             result = compressor.process(
-                input_folder=input_dir,
+                input_paths=input_dir,
                 output_folder=output_dir,
                 quality=50,
             )
@@ -29,10 +33,388 @@ class TestImageCompressor(unittest.TestCase):
             self.assertIsNotNone(result.original_size)
             self.assertIsNotNone(result.processed_size)
 
+    def test_compress_nested_folder_accounts_sizes(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            nested = os.path.join(input_dir, "nested")
+            os.makedirs(nested)
+            Image.new("RGB", (32, 32), color=(0, 255, 0)).save(
+                os.path.join(nested, "inner.jpg"), quality=95
+            )
+            notes_path = os.path.join(input_dir, "notes.txt")
+            with open(notes_path, "wb") as f:
+                f.write(b"x" * 100)
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                quality=50,
+            )
+
+            self.assertTrue(result.success)
+            out_img = os.path.join(output_dir, "nested", "inner.jpg")
+            out_notes = os.path.join(output_dir, "notes.txt")
+            self.assertTrue(os.path.exists(out_img))
+            self.assertTrue(os.path.exists(out_notes))
+            self.assertEqual(
+                result.original_size,
+                os.path.getsize(os.path.join(nested, "inner.jpg"))
+                + os.path.getsize(notes_path),
+            )
+            self.assertEqual(
+                result.processed_size,
+                os.path.getsize(out_img) + os.path.getsize(out_notes),
+            )
+            # Non-image files are hardlinked rather than copied
+            self.assertTrue(os.path.samefile(out_notes, notes_path))
+
+    def test_compress_in_place_keeps_non_image_files(self):
+        compressor = ImageCompressor()
+
+        for symlink in (False, True):
+            with tempfile.TemporaryDirectory() as folder:
+                Image.new("RGB", (32, 32), color=(0, 255, 0)).save(
+                    os.path.join(folder, "inner.jpg"), quality=95
+                )
+                # Compact enough to take the copy-unchanged path
+                flat_path = os.path.join(folder, "flat.jpg")
+                Image.new("RGB", (512, 512), color=(10, 20, 30)).save(
+                    flat_path, quality=20
+                )
+                with open(flat_path, "rb") as f:
+                    flat = f.read()
+                notes_path = os.path.join(folder, "notes.txt")
+                with open(notes_path, "wb") as f:
+                    f.write(b"x" * 100)
+
+                result = compressor.process(
+                    input_paths=[folder],
+                    output_folder=folder,
+                    symlink_passthrough=symlink,
+                )
+
+                self.assertTrue(result.success, result.message)
+                self.assertFalse(os.path.islink(notes_path))
+                with open(notes_path, "rb") as f:
+                    self.assertEqual(f.read(), b"x" * 100)
+                with open(flat_path, "rb") as f:
+                    self.assertEqual(f.read(), flat)
+
+    def test_compress_folder_with_process_pool(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            for i in range(3):
+                Image.new("RGB", (16, 16), color=(i, 0, 0)).save(
+                    os.path.join(input_dir, f"img{i}.png")
+                )
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                quality=90,
+                processes=True,
+            )
+
+            self.assertTrue(result.success)
+            self.assertEqual(
+                sorted(os.listdir(output_dir)), ["img0.png", "img1.png", "img2.png"]
+            )
+
+    def test_compact_jpeg_is_copied_unchanged(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "flat.jpg")
+            # A flat colour encodes to far fewer bytes than a typical photo
+            Image.new("RGB", (512, 512), color=(10, 20, 30)).save(img_path, quality=20)
+            with open(img_path, "rb") as f:
+                source = f.read()
+
+            result = compressor.process(
+                input_paths=[img_path],
+                output_folder=output_dir,
+                quality=85,
+            )
+
+            self.assertTrue(result.success)
+            with open(os.path.join(output_dir, "flat.jpg"), "rb") as f:
+                self.assertEqual(f.read(), source)
+
+    def test_mid_quality_photo_is_recompressed_smaller(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "photo.jpg")
+            # Upscaled noise: smooth, photo-like content
+            Image.merge(
+                "RGB",
+                [
+                    Image.effect_noise((80, 60), 80).resize(
+                        (640, 480), Image.Resampling.BICUBIC
+                    )
+                    for _ in range(3)
+                ],
+            ).save(img_path, quality=90)
+
+            result = compressor.process(
+                input_paths=[img_path],
+                output_folder=output_dir,
+                quality=80,
+            )
+
+            self.assertTrue(result.success)
+            self.assertLess(
+                os.path.getsize(os.path.join(output_dir, "photo.jpg")),
+                os.path.getsize(img_path),
+            )
+
+    def test_max_dimension_downscales_large_images(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "wide.jpg")
+            Image.new("RGB", (200, 100), color=(0, 0, 255)).save(img_path)
+
+            result = compressor.process(
+                input_paths=[img_path],
+                output_folder=output_dir,
+                quality=80,
+                max_dimension=50,
+            )
+
+            self.assertTrue(result.success)
+            with Image.open(os.path.join(output_dir, "wide.jpg")) as out:
+                self.assertEqual(out.size, (50, 25))
+
+    def test_jpeg_with_alpha_is_converted(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "alpha.jpg")
+            # Saved as PNG data under a .jpg name, as exported by some tools
+            Image.new("RGBA", (16, 16), color=(255, 0, 0, 128)).save(
+                img_path, format="PNG"
+            )
+
+            result = compressor.process(
+                input_paths=[img_path],
+                output_folder=output_dir,
+                quality=80,
+            )
+
+            self.assertTrue(result.success)
+            with Image.open(os.path.join(output_dir, "alpha.jpg")) as out:
+                self.assertEqual(out.format, "JPEG")
+                self.assertEqual(out.mode, "RGB")
+
+    def test_encode_failures_are_reported_in_message(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            good_path = os.path.join(input_dir, "good.png")
+            Image.new("RGB", (64, 64), color=(1, 2, 3)).save(good_path)
+            with open(good_path, "rb") as f:
+                data = f.read()
+            # Header intact so the file opens, pixel data cut short
+            with open(os.path.join(input_dir, "broken.png"), "wb") as f:
+                f.write(data[: len(data) // 2])
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                quality=80,
+            )
+
+            self.assertTrue(result.success)
+            self.assertIn("1 failure", result.message)
+            self.assertIn("broken.png", result.message)
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "good.png")))
+
+    def test_dedupe_links_hardlinked_inputs(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "a.png")
+            Image.new("RGB", (64, 64), color=(0, 255, 0)).save(img_path)
+            os.link(img_path, os.path.join(input_dir, "b.png"))
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                dedupe=True,
+            )
+
+            self.assertTrue(result.success)
+            out_a = os.path.join(output_dir, "a.png")
+            out_b = os.path.join(output_dir, "b.png")
+            self.assertTrue(os.path.samefile(out_a, out_b))
+            self.assertEqual(result.processed_size, 2 * os.path.getsize(out_a))
+
+    def test_dedupe_only_links_outputs_of_the_same_format(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "a.jpg")
+            Image.new("RGB", (64, 64), color=(0, 255, 0)).save(img_path, quality=95)
+            os.link(img_path, os.path.join(input_dir, "b.png"))
+            os.link(img_path, os.path.join(input_dir, "c.jpeg"))
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                dedupe=True,
+            )
+
+            self.assertTrue(result.success)
+            with Image.open(os.path.join(output_dir, "b.png")) as out:
+                self.assertEqual(out.format, "PNG")
+            self.assertTrue(
+                os.path.samefile(
+                    os.path.join(output_dir, "a.jpg"),
+                    os.path.join(output_dir, "c.jpeg"),
+                )
+            )
+
+    def test_dedupe_fails_duplicates_of_failed_input_despite_stale_output(self):
+        compressor = ImageCompressor()
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "a.png")
+            Image.new("RGB", (64, 64), color=(0, 255, 0)).save(img_path)
+            with open(img_path, "r+b") as f:
+                f.truncate(100)
+            os.link(img_path, os.path.join(input_dir, "b.png"))
+            # Left over from an earlier run into the same output folder
+            with open(os.path.join(output_dir, "a.png"), "wb") as f:
+                f.write(b"STALE")
+
+            result = compressor.process(
+                input_paths=[input_dir],
+                output_folder=output_dir,
+                dedupe=True,
+            )
+
+            self.assertIn("2 failure(s)", result.message)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "b.png")))
+
+    def _fake_cv2(self, imread_result, imencode_result):
+        cv2 = MagicMock(
+            IMREAD_COLOR=1,
+            IMREAD_IGNORE_ORIENTATION=128,
+            IMWRITE_JPEG_QUALITY=1,
+            IMWRITE_JPEG_OPTIMIZE=3,
+            IMWRITE_JPEG_PROGRESSIVE=2,
+        )
+        cv2.imread.return_value = imread_result
+        cv2.imencode.return_value = imencode_result
+        return cv2
+
+    def _compress_with_cv2(self, cv2, output_dir, input_dir):
+        img_path = os.path.join(input_dir, "noise.jpg")
+        Image.effect_noise((64, 64), 64).convert("RGB").save(img_path, quality=100)
+        with patch.object(image_module, "cv2", cv2), patch.object(
+            image_module, "_JPEG_BACKENDS", [image_module._encode_jpeg_cv2]
+        ):
+            return ImageCompressor().process(
+                input_paths=[img_path],
+                output_folder=output_dir,
+                quality=50,
+            )
+
+    def test_cv2_backend_writes_its_encoded_bytes(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8), color=(255, 0, 0)).save(buf, "JPEG")
+        encoded = MagicMock()
+        encoded.tobytes.return_value = buf.getvalue()
+        cv2 = self._fake_cv2(object(), (True, encoded))
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            result = self._compress_with_cv2(cv2, output_dir, input_dir)
+
+            self.assertTrue(result.success)
+            quality_args = cv2.imencode.call_args[0][2]
+            self.assertEqual(quality_args[:2], [cv2.IMWRITE_JPEG_QUALITY, 50])
+            with open(os.path.join(output_dir, "noise.jpg"), "rb") as f:
+                self.assertEqual(f.read(), buf.getvalue())
+
+    def test_cv2_failures_fall_back_to_pillow(self):
+        for cv2 in (
+            self._fake_cv2(None, None),
+            self._fake_cv2(object(), (False, None)),
+        ):
+            with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+                result = self._compress_with_cv2(cv2, output_dir, input_dir)
+
+                cv2.imread.assert_called_once()
+                self.assertEqual(
+                    result.message, "Image compression completed successfully."
+                )
+                with Image.open(os.path.join(output_dir, "noise.jpg")) as out:
+                    self.assertEqual(out.size, (64, 64))
+
+    def test_turbojpeg_failure_falls_back_to_pillow(self):
+        compressor = ImageCompressor()
+        turbo = MagicMock()
+        turbo.decode.side_effect = OSError("Unsupported color conversion request")
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            img_path = os.path.join(input_dir, "noise.jpg")
+            Image.effect_noise((64, 64), 64).convert("RGB").save(img_path, quality=100)
+
+            with patch.object(image_module, "_turbo", turbo), patch.object(
+                image_module, "_JPEG_BACKENDS", [image_module._encode_jpeg_turbo]
+            ):
+                result = compressor.process(
+                    input_paths=[img_path],
+                    output_folder=output_dir,
+                    quality=50,
+                )
+
+            turbo.decode.assert_called_once()
+            self.assertEqual(
+                result.message, "Image compression completed successfully."
+            )
+            with Image.open(os.path.join(output_dir, "noise.jpg")) as out:
+                self.assertEqual(out.format, "JPEG")
+
+    def test_concurrent_runs_on_one_instance_keep_separate_failures(self):
+        compressor = ImageCompressor()
+        results = {}
+
+        with tempfile.TemporaryDirectory() as good_dir, tempfile.TemporaryDirectory() as bad_dir, tempfile.TemporaryDirectory() as output_dir:
+            for i in range(40):
+                Image.new("RGB", (16, 16), color=(i, 0, 0)).save(
+                    os.path.join(good_dir, f"{i}.png")
+                )
+            with open(os.path.join(bad_dir, "broken.png"), "wb") as f:
+                f.write(b"\x89PNG\r\n\x1a\n" + b"\0" * 64)
+
+            def run(name, folder):
+                results[name] = compressor.process(
+                    input_paths=[folder],
+                    output_folder=os.path.join(output_dir, name),
+                )
+
+            threads = [
+                threading.Thread(target=run, args=("good", good_dir)),
+                threading.Thread(target=run, args=("bad", bad_dir)),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(
+            results["good"].message, "Image compression completed successfully."
+        )
+        self.assertIn("broken.png", results["bad"].message)
+
     def test_compress_images_missing_input_folder(self):
         compressor = ImageCompressor()
         result = compressor.process(
-            input_folder="/path/does/not/exist",
+            input_paths="/path/does/not/exist",
             output_folder="/tmp/out",
             quality=80,
         )
@@ -2,7 +2,12 @@ import unittest
 
 from src.base import Downloader, MediaProcessor, MediaType, ProcessingResult
 from src.main import MediaBenchCLI
-from src.registry import ProcessorRegistry
+from src.registry import (
+    DownloaderInfo,
+    ProcessorInfo,
+    ProcessorRegistry,
+    create_default_registry,
+)
 
 
 class _DummyProcessor(MediaProcessor):
@@ -88,6 +93,66 @@ class TestProcessorRegistry(unittest.TestCase):
         with self.assertRaises(KeyError):
             reg.get_downloader("missing")
 
+    def test_missing_key_error_lists_keys_registered_since(self):
+        reg = ProcessorRegistry()
+        with self.assertRaises(KeyError):
+            reg.get_processor("p")
+        reg.register_processor("p", _DummyProcessor())
+        with self.assertRaisesRegex(KeyError, r"\['p'\]"):
+            reg.get_processor("missing")
+
+    def test_list_processors_is_read_only_view(self):
+        reg = ProcessorRegistry()
+        processors = reg.list_processors()
+        reg.register_processor("p", _DummyProcessor())
+        self.assertIn("p", processors)
+        with self.assertRaises(TypeError):
+            processors["q"] = _DummyProcessor()
+
+    def test_factory_is_instantiated_once_on_first_lookup(self):
+        reg = ProcessorRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return _DummyProcessor()
+
+        reg.register_processor("p", factory)
+        self.assertEqual(calls, [])
+        self.assertIs(reg.get_processor("p"), reg.get_processor("p"))
+        self.assertEqual(len(calls), 1)
+
+    def test_list_keeps_registration_order(self):
+        reg = ProcessorRegistry()
+        reg.register_downloader("a", _DummyDownloader)
+        reg.register_downloader("b", _DummyDownloader)
+        reg.get_downloader("b")
+        self.assertEqual(list(reg.list_downloaders()), ["a", "b"])
+
+    def test_describe_does_not_instantiate_factories_with_info(self):
+        reg = ProcessorRegistry()
+        reg.register_processor(
+            "p", self.fail, ProcessorInfo("Dummy Processor", MediaType.IMAGE)
+        )
+        reg.register_downloader("d", _DummyDownloader)
+        self.assertEqual(
+            reg.describe_processors(),
+            {"p": ProcessorInfo("Dummy Processor", MediaType.IMAGE)},
+        )
+        self.assertEqual(
+            reg.describe_downloaders(),
+            {"d": DownloaderInfo("Dummy Downloader", "Dummy")},
+        )
+
+    def test_default_registry_info_matches_instances(self):
+        reg = create_default_registry()
+        for key, info in reg.describe_processors().items():
+            processor = reg.get_processor(key)
+            self.assertEqual(info, (processor.name, processor.media_type))
+        for key, info in reg.describe_downloaders().items():
+            downloader = reg.get_downloader(key)
+            self.assertEqual(info, (downloader.name, downloader.source))
+
 
 class TestCLI(unittest.TestCase):
     def _make_cli(self) -> MediaBenchCLI:
@@ -106,6 +171,16 @@ class TestCLI(unittest.TestCase):
         rc = cli.run(["compress-images", "-i", "in", "-o", "out"])
         self.assertEqual(rc, 0)
 
+    def test_cli_only_instantiates_the_selected_command(self):
+        reg = ProcessorRegistry()
+        reg.register_processor("compress-images", _DummyProcessor)
+        reg.register_downloader(
+            "youtube-video", self.fail, DownloaderInfo("Dummy Downloader", "Dummy")
+        )
+        cli = MediaBenchCLI(registry=reg)
+        self.assertEqual(cli.run([]), 0)
+        self.assertEqual(cli.run(["compress-images", "-i", "in", "-o", "out"]), 0)
+
     def test_cli_dispatch_downloader_and_maps_kwargs(self):
         cli = self._make_cli()
         rc = cli.run(["youtube-video", "-u", "http://example", "-o", "./x"])
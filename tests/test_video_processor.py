@@ -1,7 +1,8 @@
 import os
+import subprocess
 import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from src.processors.video import VideoCompressor
 
@@ -21,23 +22,23 @@ class TestVideoCompressor(unittest.TestCase):
             result = compressor.process(input_file=path, output_dir=tmp)
             self.assertFalse(result.success)
 
-    @patch("src.processors.video.VideoFileClip")
-    def test_compress_success_with_mocked_moviepy(self, video_file_clip):
+    @patch("src.processors.video._probe_video_bitrate", return_value=None)
+    @patch("src.processors.video._select_encoder")
+    @patch("src.processors.video.subprocess.run")
+    def test_compress_success_with_mocked_ffmpeg(self, run, select_encoder, _probe):
         compressor = VideoCompressor()
+        select_encoder.return_value = ("libx264", [], [])
 
         with tempfile.TemporaryDirectory() as tmp:
             input_path = os.path.join(tmp, "video.mp4")
             with open(input_path, "wb") as f:
                 f.write(b"0" * 1024)
 
-            mock_clip = MagicMock()
-
-            def _write_videofile(out_path, **kwargs):
-                with open(out_path, "wb") as out:
+            def _run(command, **kwargs):
+                with open(command[-1], "wb") as out:
                     out.write(b"1" * 512)
 
-            mock_clip.write_videofile.side_effect = _write_videofile
-            video_file_clip.return_value = mock_clip
+            run.side_effect = _run
 
             result = compressor.process(
                 input_file=input_path,
@@ -52,7 +53,64 @@ class TestVideoCompressor(unittest.TestCase):
             self.assertTrue(os.path.exists(result.output_path))
             self.assertEqual(result.original_size, 1024)
             self.assertEqual(result.processed_size, 512)
-            mock_clip.close.assert_called()
+            command = run.call_args[0][0]
+            self.assertIn("libx264", command)
+            self.assertIn("500k", command)
+
+    @patch("src.processors.video._probe_video_bitrate", return_value=None)
+    @patch("src.processors.video._select_encoder")
+    @patch("src.processors.video.subprocess.run")
+    def test_hardware_encoder_failure_retries_with_libx264(
+        self, run, select_encoder, _probe
+    ):
+        compressor = VideoCompressor()
+        select_encoder.return_value = ("h264_nvenc", ["-hwaccel", "cuda"], [])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "video.mp4")
+            with open(input_path, "wb") as f:
+                f.write(b"0" * 1024)
+
+            def _run(command, **kwargs):
+                if "h264_nvenc" in command:
+                    raise subprocess.CalledProcessError(1, command)
+                with open(command[-1], "wb") as out:
+                    out.write(b"1" * 512)
+
+            run.side_effect = _run
+
+            result = compressor.process(input_file=input_path, output_dir=tmp)
+
+            self.assertTrue(result.success)
+            self.assertEqual(run.call_count, 2)
+            command = run.call_args[0][0]
+            self.assertIn("libx264", command)
+            self.assertNotIn("cuda", command)
+
+    @patch("src.processors.video._probe_video_bitrate", return_value=400_000)
+    @patch("src.processors.video.subprocess.run")
+    def test_stream_copy_when_source_bitrate_is_below_target(self, run, _probe):
+        compressor = VideoCompressor()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "video.mp4")
+            with open(input_path, "wb") as f:
+                f.write(b"0" * 1024)
+
+            def _run(command, **kwargs):
+                with open(command[-1], "wb") as out:
+                    out.write(b"1" * 1000)
+
+            run.side_effect = _run
+
+            result = compressor.process(
+                input_file=input_path, output_dir=tmp, bitrate=1000
+            )
+
+            self.assertTrue(result.success)
+            run.assert_called_once()
+            command = run.call_args[0][0]
+            self.assertEqual(command[-3:-1], ["-c", "copy"])
 
 
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
 import os
 import tempfile
 import unittest
+import wave
 from unittest.mock import MagicMock, patch
 
-from src.processors.youtube import YouTubeAudioDownloader, YouTubeVideoDownloader
+try:
+    import av
+    import numpy as np
+except ImportError:  # the PyAV conversion test is skipped without them
+    av = None
+
+from src.processors.youtube import (
+    YouTubeAudioDownloader,
+    YouTubeVideoDownloader,
+    _download_stream,
+)
 
 
 class _DummyStream:
@@ -92,6 +103,72 @@ class TestYouTubeDownloaders(unittest.TestCase):
                 self.assertEqual(result.output_path, wav_path)
                 self.assertTrue(os.path.exists(wav_path))
 
+    @patch("src.processors.youtube.requests")
+    def test_range_download_reassembles_payload(self, requests_mock):
+        payload = os.urandom(10_499)
+
+        def _get(url, headers, **kwargs):
+            start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+            response = MagicMock(status_code=206)
+            response.__enter__.return_value = response
+            response.iter_content.return_value = [
+                payload[i : min(i + 1000, end + 1)] for i in range(start, end + 1, 1000)
+            ]
+            return response
+
+        requests_mock.get.side_effect = _get
+        stream = _DummyStream()
+        stream.url = "https://example.com/video"
+        stream.filesize = len(payload)
+        stream.default_filename = "video.mp4"
+        progress = []
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            path = _download_stream(
+                stream, out_dir, lambda s, chunk, left: progress.append(left)
+            )
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), payload)
+
+        self.assertEqual(requests_mock.get.call_count, 4)
+        self.assertEqual(min(progress), 0)
+
+    @patch("src.processors.youtube.requests")
+    def test_range_download_failure_falls_back_to_pytube(self, requests_mock):
+        requests_mock.get.side_effect = IOError("connection reset")
+        stream = _DummyStream(b"payload")
+        stream.url = "https://example.com/video"
+        stream.filesize = 7
+        stream.default_filename = "downloaded.mp4"
+        with tempfile.TemporaryDirectory() as out_dir:
+            path = _download_stream(stream, out_dir)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"payload")
+
+    @unittest.skipIf(av is None, "PyAV is not installed")
+    def test_convert_to_wav_with_pyav(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            source = os.path.join(out_dir, "audio.m4a")
+            with av.open(source, "w") as container:
+                stream = container.add_stream("aac", rate=48000, layout="mono")
+                samples = np.zeros((1, 48000 // 4), dtype=np.float32)
+                frame = av.AudioFrame.from_ndarray(
+                    samples, format="fltp", layout="mono"
+                )
+                frame.sample_rate = 48000
+                container.mux(stream.encode(frame))
+                container.mux(stream.encode(None))
+
+            with patch("src.processors.youtube.subprocess.run") as run:
+                wav_path = YouTubeAudioDownloader()._convert_to_wav(source)
+            run.assert_not_called()
+
+            with wave.open(wav_path) as wav:
+                self.assertEqual(wav.getnchannels(), 2)
+                self.assertEqual(wav.getframerate(), 44100)
+                self.assertEqual(wav.getsampwidth(), 2)
+                self.assertGreater(wav.getnframes(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()